@@ -1,21 +1,33 @@
 #!/bin/bash
 
 # Script de entrada para el contenedor Docker
+WEB_URL="${WEB_URL:-http://web:8080/}"
+
 echo "🚀 Iniciando Sistema de Gestión Documental..."
 
 # Función para inicializar la base de datos SQLite
 init_database() {
     echo "🗄️ Inicializando base de datos SQLite..."
     python -c "
-from app import app, db, User, DocumentCategory
+from app import app, db, User, DocumentCategory, DocumentTask, AreaStats, rebuild_area_stats, add_missing_columns, create_missing_indexes, create_search_index, backfill_file_references
 from werkzeug.security import generate_password_hash
 import os
 
 with app.app_context():
     try:
         db.create_all()
+        add_missing_columns()
+        create_missing_indexes()
+        create_search_index()
+        backfill_file_references()
         print('✅ Base de datos SQLite inicializada correctamente')
         
+        # Poblar contadores por área si la tabla es nueva
+        if not AreaStats.query.first() and DocumentTask.query.first():
+            rebuild_area_stats()
+            db.session.commit()
+            print('✅ Contadores por área calculados')
+        
         # Crear usuario administrador por defecto si no existe
         if not User.query.filter_by(username='admin').first():
             admin_user = User(username='admin', email='david.herrera@tessacorporation.com', role='gerente', area='Administración')
@@ -48,10 +60,27 @@ with app.app_context():
 "
 }
 
+# Función para esperar a que el servicio web haya inicializado la base de datos
+wait_for_web() {
+    echo "⏳ Esperando a que ${WEB_URL} termine de inicializar la base de datos..."
+    for i in $(seq 1 60); do
+        if curl -fs -o /dev/null "${WEB_URL}"; then
+            return 0
+        fi
+        sleep 2
+    done
+    echo "⚠️ ${WEB_URL} no respondió; se continúa de todos modos"
+}
+
 # Función principal
 main() {
-    # Inicializar la base de datos
-    init_database
+    # Inicializar la base de datos (solo un contenedor: el scheduler usa
+    # SKIP_DB_INIT=true para no migrar a la vez el mismo archivo SQLite)
+    if [ "${SKIP_DB_INIT:-false}" = "true" ]; then
+        wait_for_web
+    else
+        init_database
+    fi
     
     echo "🎉 Sistema listo para iniciar!"
     
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""
+Proceso dedicado para tareas programadas y envío de la cola de emails
+"""
+import time
+from app import start_background_workers
+
+if __name__ == "__main__":
+    print("Iniciando scheduler de tareas programadas...")
+    threads = start_background_workers()
+    
+    # Mantener vivo el proceso mientras corren los hilos
+    while all(thread.is_alive() for thread in threads):
+        time.sleep(60)